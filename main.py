@@ -16,31 +16,41 @@ Production-ready:
 Deploy notes:
 - Works best with discord.py 2.x
 - Set DISCORD_TOKEN, HF_TOKEN (optional for /ask), and HACKATHONS_API_BASE (optional)
+- PIKA_LOG_LEVEL (optional, default INFO)
 """
 
 from __future__ import annotations
 
 import os
 import re
-import json
+import sys
 import time
+import bisect
 import asyncio
 import signal
 import logging
+import functools
+import itertools
 import unicodedata
 from dataclasses import dataclass, field
-from collections import defaultdict, deque
-from typing import Dict, List, Tuple
+from collections import OrderedDict, defaultdict
+from typing import Callable, Dict, Final, List, Set, Tuple
 from datetime import datetime, timezone, timedelta
 
 import discord
-from discord.ext import commands
+from discord import app_commands
+from discord.ext import commands, tasks
 from dotenv import load_dotenv
 
 import httpx
+import orjson
 import aiofiles
 
-from openai import OpenAI
+try:
+    # Optional: one-pass multi-word matcher for moderation (regex fallback below)
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
 
 # -------------------------------------------------
 # 1) CONSTANTS
@@ -48,12 +58,16 @@ from openai import OpenAI
 
 # Display limits
 MAX_EVENTS_IN_EMBED = 10
+# Hackathon URLs remembered between auto-alert cycles (oldest dropped first)
+MAX_REMEMBERED_HACKATHON_URLS = 1000
 MAX_EVENTS_IN_HACKATHONS_CMD = 20
 RECENT_WINNERS_DISPLAY_COUNT = 3
 MAX_HACKATHON_NAME_LENGTH = 100
 MAX_TEAM_NAME_LENGTH = 100
 MAX_PROJECT_LENGTH = 200
 MAX_PRIZE_LENGTH = 100
+# Hackathon names a sloppy announcement parse leaves behind (never real winners)
+_BAD_HACKATHON_NAMES = frozenset(("winner", "winners"))
 
 # Raid detection
 RAID_JOIN_WINDOW_SECONDS = 30
@@ -68,18 +82,46 @@ MENTION_SPAM_THRESHOLD = 6
 EMOJI_SPAM_THRESHOLD = 15
 AUTO_BAN_STRIKE_THRESHOLD = 3
 
+# Moderation result cache (repeated short messages skip the scan)
+MODERATION_CACHE_SIZE = 4096
+MODERATION_CACHE_MAX_TEXT_LENGTH = 2000
+
+# Parsed start_date strings kept in memory (they repeat across alert cycles)
+DATE_PARSE_CACHE_SIZE = 1024
+
 # Intervals (in hours)
 AUTO_ALERT_INTERVAL_HOURS = 24 * 7
 
+# Upper bound on a manual !sync round trip
+TREE_SYNC_TIMEOUT_SECONDS = 30
+
+# Persistence (seconds to coalesce winners/strikes writes)
+PERSIST_DEBOUNCE_SECONDS = 2.0
+
+# ...unless this many changes pile up first (e.g. strikes during a raid)
+PERSIST_MAX_PENDING = 25
+
+# Hackathon feeds: serve the parsed body from memory for this long before revalidating
+FEED_CACHE_TTL_SECONDS = 300
+
+# Mod-log batching (Discord allows 10 embeds and 6000 embed characters per message)
+MOD_LOG_QUEUE_SIZE = 1000
+MOD_LOG_BATCH_SIZE = 10
+MOD_LOG_BATCH_MAX_CHARS = 6000
+MOD_LOG_FLUSH_SECONDS = 1.0
+MOD_LOG_DRAIN_TIMEOUT_SECONDS = 5.0
+
 # -------------------------------------------------
 # 2) ENV + CONFIG
 # -------------------------------------------------
 load_dotenv()
-TOKEN = os.getenv("DISCORD_TOKEN")
+TOKEN: Final[str | None] = os.getenv("DISCORD_TOKEN")
 
 # Hugging Face token + model for /ask (via router.huggingface.co/v1)
 HF_TOKEN = os.getenv("HF_TOKEN") or os.getenv("HUGGINGFACE_TOKEN")
 HF_MODEL = os.getenv("HUGGINGFACE_MODEL", "Qwen/Qwen2.5-72B-Instruct")
+# Give up on a hung completion well before the interaction token expires
+HF_REQUEST_TIMEOUT_SECONDS = 25
 
 # Channel names used by the bot (must match server)
 WELCOME_CHANNEL_NAME = "welcome-verify"
@@ -87,6 +129,14 @@ HACKATHON_CHANNEL_NAME = "all-hackathons"
 ANNOUNCEMENTS_CHANNEL_NAME = "announcements"
 MOD_LOG_CHANNEL_NAME = "mod-logs"
 
+# Join messages (static parts resolved once; only the member is filled in per join)
+WELCOME_DM_TEMPLATE = (
+    "Welcome to Hackeroos, {name}! 🦘💛\n"
+    "I'm **Pika-Bot**. Use `/pika-help` in the server to see what I can do.\n"
+    f"To unlock channels, run `/verify` in #{WELCOME_CHANNEL_NAME}."
+)
+WELCOME_CHANNEL_TEMPLATE = "⚡ G'day {mention}! Welcome to **{guild}** — run `/verify` to get access!"
+
 # Roles used by the bot
 ROLE_VERIFY = "Verified Hackeroos"
 ROLE_TECH = "Tech Hackeroos"
@@ -97,6 +147,7 @@ QUARANTINE_ROLE_NAME = "Quarantined"
 WINNERS_FILE = "winners.json"
 STRIKES_FILE = "strikes.json"
 BLOCKED_WORDS_FILE = os.getenv("BLOCKED_WORDS_FILE", "blocked_words.json")
+ALLOWED_WORDS_FILE = os.getenv("ALLOWED_WORDS_FILE", "allowed_words.json")
 
 # Hackathons backend
 HACKATHONS_API_BASE = os.getenv(
@@ -111,6 +162,11 @@ HACKATHONS_JSON_URL = os.getenv(
 # -------------------------------------------------
 # 3) DEFAULT BLOCKED WORDS (fallback if no JSON file)
 # -------------------------------------------------
+# Filter policy: a blocked word matches anywhere in the normalized text, so
+# inflections and compounds ("motherfucking", "bullshit") need no entries of
+# their own. A hit is ignored only when it lies entirely inside an occurrence
+# of an allowed word (innocent words that happen to contain a blocked one).
+# The same rule applies to lists loaded from BLOCKED_WORDS_FILE / ALLOWED_WORDS_FILE.
 DEFAULT_BLOCKED_WORDS = [
     "shit", "fuck", "bitch", "bastard", "cunt", "slut", "whore",
     "dick", "pussy", "fag", "faggot", "nigga", "nigger",
@@ -118,21 +174,62 @@ DEFAULT_BLOCKED_WORDS = [
     "porn", "nsfw", "sex", "cum", "jerk off", "jerking", "rape",
 ]
 
+# Fragments are fine: "cumul" covers cumulative / accumulate, "grape" covers grapes
+DEFAULT_ALLOWED_WORDS = [
+    "scunthorpe", "dickens", "dickinson", "snigger", "retardant", "oxymoron",
+    "essex", "sussex", "wessex", "middlesex", "sextant", "sextet", "sexton",
+    "cumul", "cumber", "document", "circum", "cumbent", "succumb", "cumin",
+    "grape", "drape", "scrape", "trapeze", "therapist", "rapeseed",
+]
 
-def load_blocked_words() -> List[str]:
-    """Load blocked words from JSON file or use defaults."""
-    if os.path.exists(BLOCKED_WORDS_FILE):
+
+def _load_word_list(path: str, default: List[str]) -> List[str]:
+    if os.path.exists(path):
         try:
-            with open(BLOCKED_WORDS_FILE, "r", encoding="utf-8") as f:
-                words = json.load(f)
+            with open(path, "rb") as f:
+                words = orjson.loads(f.read())
                 if isinstance(words, list):
-                    return [w.lower() for w in words if isinstance(w, str)]
+                    return [w.lower() for w in words if isinstance(w, str) and w]
         except Exception as e:
-            logging.warning("Could not load blocked words file: %s", e)
-    return DEFAULT_BLOCKED_WORDS
+            logging.warning("Could not load word list %s: %s", path, e)
+    return default
+
+
+def load_blocked_words() -> List[str]:
+    """Load blocked words from JSON file or use defaults."""
+    return _load_word_list(BLOCKED_WORDS_FILE, DEFAULT_BLOCKED_WORDS)
+
+
+def load_allowed_words() -> List[str]:
+    """Load allowed (innocent) words from JSON file or use defaults."""
+    return _load_word_list(ALLOWED_WORDS_FILE, DEFAULT_ALLOWED_WORDS)
+
+
+def compile_word_list(words: List[str]) -> re.Pattern:
+    """One alternation that reports every (overlapping) occurrence via group 1."""
+    if not words:
+        return re.compile(r"(?!x)x()")
+    # Longest first so entries sharing a start ("fag" / "faggot") report the longer word
+    alternation = "|".join(re.escape(w) for w in sorted(set(words), key=len, reverse=True))
+    # Zero-width lookahead: finditer tries every position, so overlapping hits all show up
+    return re.compile("(?=(" + alternation + "))")
+
+
+def build_blocked_words_automaton(words: List[str]):
+    """Aho-Corasick automaton over the blocked words, or None without pyahocorasick."""
+    if ahocorasick is None or not words:
+        return None
+    automaton = ahocorasick.Automaton()
+    for w in set(words):
+        automaton.add_word(w, w)
+    automaton.make_automaton()
+    return automaton
 
 
 BLOCKED_WORDS = load_blocked_words()
+BLOCKED_WORDS_PATTERN = compile_word_list(BLOCKED_WORDS)
+BLOCKED_WORDS_AUTOMATON = build_blocked_words_automaton(BLOCKED_WORDS)
+ALLOWED_WORDS_PATTERN = compile_word_list(load_allowed_words())
 
 # -------------------------------------------------
 # 4) MONTH MAP FOR DATE PARSING
@@ -155,20 +252,22 @@ MONTH_MAP = {
 # -------------------------------------------------
 # 5) REGEX PATTERNS
 # -------------------------------------------------
+_EMOJI_RANGES = [
+    (0x1F300, 0x1F5FF),
+    (0x1F600, 0x1F64F),
+    (0x1F680, 0x1F6FF),
+    (0x1F700, 0x1F77F),
+    (0x1F780, 0x1F7FF),
+    (0x1F800, 0x1F8FF),
+    (0x1F900, 0x1F9FF),
+    (0x1FA00, 0x1FA6F),
+    (0x1FA70, 0x1FAFF),
+    (0x2600, 0x26FF),
+    (0x2700, 0x27BF),
+]
+
 EMOJI_PATTERN = re.compile(
-    "["
-    "\U0001F300-\U0001F5FF"
-    "\U0001F600-\U0001F64F"
-    "\U0001F680-\U0001F6FF"
-    "\U0001F700-\U0001F77F"
-    "\U0001F780-\U0001F7FF"
-    "\U0001F800-\U0001F8FF"
-    "\U0001F900-\U0001F9FF"
-    "\U0001FA00-\U0001FA6F"
-    "\U0001FA70-\U0001FAFF"
-    "\u2600-\u26FF"
-    "\u2700-\u27BF"
-    "]+",
+    "[" + "".join(f"{chr(lo)}-{chr(hi)}" for lo, hi in _EMOJI_RANGES) + "]+",
     flags=re.UNICODE,
 )
 
@@ -180,12 +279,68 @@ WINNER_PATTERN = re.compile(
     re.IGNORECASE,
 )
 
+WINNER_WORD_PATTERN = re.compile(r"\b(winner|winners)\b", re.IGNORECASE)
+
+# Substring trigger for the winner branch in on_message (no lowercased copy)
+WINNER_TRIGGER_PATTERN = re.compile("winner", re.IGNORECASE)
+
+# Dashes / colons dropped from winner hackathon names
+WINNER_PUNCT_TRANSLATION = str.maketrans("", "", "-–:")
+
+# ISO 8601 date, optionally with time + "Z" / "+HH:MM" offset
+ISO_DATE_PATTERN = re.compile(
+    r"^(\d{4})-(\d{1,2})-(\d{1,2})"
+    r"(?:T(\d{1,2}):(\d{1,2}):(\d{1,2})(Z|[+-]\d{2}:?\d{2}))?$"
+)
+
+# Any month abbreviation; month-name formats can't match without one
+MONTH_ABBR_PATTERN = re.compile(
+    "|".join(sorted({name[:3] for name in MONTH_MAP})),
+    re.IGNORECASE,
+)
+
+# "Oct 31 - Dec 05, 2025"
+DEVPOST_DATE_PATTERN = re.compile(r"([A-Za-z]{3,9})\s+(\d{1,2}),?\s+(\d{4})")
+
+# "Feb 14th - 15th, 2026" / "Feb 14th"
+MLH_DATE_PATTERN = re.compile(
+    r"([A-Za-z]{3,9})\s+(\d{1,2})(?:st|nd|rd|th)?"
+    r"(?:\s*-\s*\d{1,2}(?:st|nd|rd|th)?)?"
+    r"(?:,\s*(\d{4}))?"
+)
+
+# YYYY-MM-DD anywhere in a string
+EMBEDDED_ISO_DATE_PATTERN = re.compile(r"(\d{4})-(\d{2})-(\d{2})")
+
+# Single letters separated by whitespace ("l e e t")
+SPACED_LETTERS_PATTERN = re.compile(r"(?<=\b\w)\s+(?=\w\b)")
+
+# l33t-speak substitutions applied by normalize_text
+LEET_TRANSLATION = str.maketrans({
+    "0": "o", "1": "i", "3": "e", "4": "a",
+    "5": "s", "@": "a", "$": "s", "!": "i",
+})
+
+# ASCII characters that normalize to the first letter of some blocked word.
+# ASCII text containing none of them cannot contain a blocked word.
+_BLOCKED_INITIALS = {w[0] for w in BLOCKED_WORDS if w}
+BLOCKED_FIRST_CHARS = frozenset(
+    ch for ch in map(chr, range(128))
+    if ch.translate(LEET_TRANSLATION).lower() in _BLOCKED_INITIALS
+)
+
+# ASCII messages shorter than this can't trip the word filter, a mention or
+# emoji spam check, or a winner post, so on_message skips straight to commands
+SHORT_MESSAGE_LENGTH = min(3, min(map(len, BLOCKED_WORDS), default=3))
+
 # -------------------------------------------------
 # 6) LOGGING SETUP
 # -------------------------------------------------
 handler = logging.FileHandler(filename="discord.log", encoding="utf-8", mode="w")
+# PIKA_LOG_LEVEL=DEBUG for troubleshooting; discord.py is very chatty below INFO
+LOG_LEVEL = logging.getLevelNamesMapping().get(os.getenv("PIKA_LOG_LEVEL", "INFO").upper(), logging.INFO)
 logging.basicConfig(
-    level=logging.INFO,
+    level=LOG_LEVEL,
     format="%(asctime)s | %(levelname)s | %(name)s | %(message)s",
 )
 log = logging.getLogger("pika-bot")
@@ -195,9 +350,21 @@ log = logging.getLogger("pika-bot")
 # -------------------------------------------------
 def strip_emojis(text: str) -> str:
     """Remove emoji characters from text."""
+    if text.isascii():
+        return text
     return EMOJI_PATTERN.sub("", text)
 
 
+def count_emojis(text: str, limit: int | None = None) -> int:
+    """Count emoji runs in text (same result as len(EMOJI_PATTERN.findall(text))).
+
+    With `limit`, the scan stops once that many runs have been found.
+    """
+    if text.isascii():
+        return 0
+    return sum(1 for _ in itertools.islice(EMOJI_PATTERN.finditer(text), limit))
+
+
 def normalize_text(text: str) -> str:
     """
     Normalize text for word filtering:
@@ -205,25 +372,53 @@ def normalize_text(text: str) -> str:
     - Handle l33t speak
     - Remove spacing tricks
     """
-    normalized = unicodedata.normalize("NFKD", text)
-    ascii_text = normalized.encode("ascii", "ignore").decode("ascii")
+    if text.isascii():
+        # Plain ASCII is already NFKD-normalized; skip the decomposition pass
+        ascii_text = text
+    else:
+        if not unicodedata.is_normalized("NFKD", text):
+            text = unicodedata.normalize("NFKD", text)
+        ascii_text = text.encode("ascii", "ignore").decode("ascii")
 
     # Remove spaces between single characters (l e e t)
-    cleaned = re.sub(r"(?<=\b\w)\s+(?=\w\b)", "", ascii_text)
+    cleaned = SPACED_LETTERS_PATTERN.sub("", ascii_text)
 
-    substitutions = {
-        "0": "o", "1": "i", "3": "e", "4": "a",
-        "5": "s", "@": "a", "$": "s", "!": "i"
-    }
-    for old, new in substitutions.items():
-        cleaned = cleaned.replace(old, new)
+    return cleaned.translate(LEET_TRANSLATION).lower()
 
-    return cleaned.lower()
 
+def _blocked_word_spans(normalized: str):
+    """(start, end) of every blocked-word occurrence, overlapping ones included."""
+    if BLOCKED_WORDS_AUTOMATON is not None:
+        for end, word in BLOCKED_WORDS_AUTOMATON.iter(normalized):
+            yield end - len(word) + 1, end + 1
+    else:
+        for m in BLOCKED_WORDS_PATTERN.finditer(normalized):
+            yield m.span(1)
 
-def contains_blocked_word(text: str) -> bool:
+
+def _scan_for_blocked_word(text: str) -> bool:
     normalized = normalize_text(text)
-    return any(bad in normalized for bad in BLOCKED_WORDS)
+    allowed = None
+    for start, end in _blocked_word_spans(normalized):
+        # Clean text (nearly all of it) never gets here, so the allow scan is lazy
+        if allowed is None:
+            allowed = [m.span(1) for m in ALLOWED_WORDS_PATTERN.finditer(normalized)]
+        if not any(a <= start and end <= b for a, b in allowed):
+            return True
+    return False
+
+
+_cached_scan_for_blocked_word = functools.lru_cache(maxsize=MODERATION_CACHE_SIZE)(_scan_for_blocked_word)
+
+
+def contains_blocked_word(text: str) -> bool:
+    # Cheap character test before normalizing (and before filling the cache)
+    if text.isascii() and BLOCKED_FIRST_CHARS.isdisjoint(text):
+        return False
+    # Long pastes are rarely repeated; keep them out of the cache
+    if len(text) > MODERATION_CACHE_MAX_TEXT_LENGTH:
+        return _scan_for_blocked_word(text)
+    return _cached_scan_for_blocked_word(text)
 
 
 def is_online_event(event: dict) -> bool:
@@ -245,33 +440,59 @@ def sanitize_input(text: str, max_length: int = 100) -> str:
     return discord.utils.escape_markdown(cleaned)
 
 
-def parse_iso_date(date_str: str | None) -> datetime | None:
-    if not date_str:
-        return None
+def is_valid_hackathon_name(name: str) -> bool:
+    return name.strip().lower() not in _BAD_HACKATHON_NAMES
 
-    s = date_str.strip()
 
-    # ISO with Z
-    try:
-        if s.endswith("Z"):
-            return datetime.strptime(s, "%Y-%m-%dT%H:%M:%SZ").replace(tzinfo=timezone.utc)
-    except Exception:
-        pass
+def _iso_match_to_datetime(m: re.Match) -> datetime:
+    year, month, day, hour, minute, second, tz = m.groups()
+    tzinfo = timezone.utc
+    if tz and tz != "Z":
+        sign = -1 if tz[0] == "-" else 1
+        digits = tz[1:].replace(":", "")
+        offset = timedelta(hours=int(digits[:2]), minutes=int(digits[2:]))
+        tzinfo = timezone(sign * offset)
+    return datetime(
+        int(year), int(month), int(day),
+        int(hour or 0), int(minute or 0), int(second or 0),
+        tzinfo=tzinfo,
+    )
+
 
-    # ISO with tz or plain date
-    for fmt in ("%Y-%m-%dT%H:%M:%S%z", "%Y-%m-%d"):
+def _parse_embedded_iso_date(s: str) -> datetime | None:
+    # Last resort YYYY-MM-DD anywhere in the string
+    m = EMBEDDED_ISO_DATE_PATTERN.search(s)
+    if m:
         try:
-            dt = datetime.strptime(s, fmt)
-            if dt.tzinfo is None:
-                dt = dt.replace(tzinfo=timezone.utc)
-            return dt
-        except Exception:
-            continue
+            return datetime(int(m.group(1)), int(m.group(2)), int(m.group(3)), tzinfo=timezone.utc)
+        except ValueError:
+            pass
+    return None
+
+
+@functools.lru_cache(maxsize=DATE_PARSE_CACHE_SIZE)
+def _parse_date_string(s: str) -> datetime | Tuple[int, int] | None:
+    """
+    Parse a stripped date string. Returns a datetime, or (month, day) for
+    MLH-style dates without a year, which parse_iso_date resolves against
+    the current date (kept out of the cache so it never goes stale).
+    """
+    # ISO (Z / offset / plain date)
+    m = ISO_DATE_PATTERN.match(s)
+    if m:
+        try:
+            return _iso_match_to_datetime(m)
+        except ValueError:
+            pass
+
+    # Both name-based formats need a month; skip them when none can appear
+    if not MONTH_ABBR_PATTERN.search(s):
+        return _parse_embedded_iso_date(s)
 
     # Devpost-style
-    matches = re.findall(r"([A-Za-z]{3,9})\s+(\d{1,2}),?\s+(\d{4})", s)
-    if matches:
-        month_name, day_str, year_str = matches[0]
+    m = DEVPOST_DATE_PATTERN.search(s)
+    if m:
+        month_name, day_str, year_str = m.groups()
         month = MONTH_MAP.get(month_name.lower()[:3]) or MONTH_MAP.get(month_name.lower())
         try:
             if month:
@@ -280,12 +501,7 @@ def parse_iso_date(date_str: str | None) -> datetime | None:
             pass
 
     # MLH-style
-    m = re.search(
-        r"([A-Za-z]{3,9})\s+(\d{1,2})(?:st|nd|rd|th)?"
-        r"(?:\s*-\s*\d{1,2}(?:st|nd|rd|th)?)?"
-        r"(?:,\s*(\d{4}))?",
-        s,
-    )
+    m = MLH_DATE_PATTERN.search(s)
     if m:
         month_name = m.group(1)
         day_str = m.group(2)
@@ -293,47 +509,141 @@ def parse_iso_date(date_str: str | None) -> datetime | None:
 
         month = MONTH_MAP.get(month_name.lower()[:3]) or MONTH_MAP.get(month_name.lower())
         if month:
+            if not year_str:
+                return month, int(day_str)
             try:
-                day = int(day_str)
-                if year_str:
-                    year = int(year_str)
-                else:
-                    now = datetime.now(timezone.utc)
-                    year = now.year
-                    try_date = datetime(year, month, day, tzinfo=timezone.utc)
-                    if try_date < now:
-                        year += 1
-                return datetime(year, month, day, tzinfo=timezone.utc)
+                return datetime(int(year_str), month, int(day_str), tzinfo=timezone.utc)
             except Exception:
                 pass
 
-    # Last resort YYYY-MM-DD
-    m = re.search(r"\d{4}-\d{2}-\d{2}", s)
-    if m:
-        try:
-            return datetime.strptime(m.group(0), "%Y-%m-%d").replace(tzinfo=timezone.utc)
-        except Exception:
-            pass
+    return _parse_embedded_iso_date(s)
 
-    return None
+
+def parse_iso_date(date_str: str | None) -> datetime | None:
+    if not date_str:
+        return None
+
+    s = date_str.strip()
+    parsed = _parse_date_string(s)
+    if not isinstance(parsed, tuple):
+        return parsed
+
+    # MLH-style without a year: next occurrence of that day
+    month, day = parsed
+    try:
+        now = datetime.now(timezone.utc)
+        year = now.year
+        try_date = datetime(year, month, day, tzinfo=timezone.utc)
+        if try_date < now:
+            year += 1
+        return datetime(year, month, day, tzinfo=timezone.utc)
+    except Exception:
+        return _parse_embedded_iso_date(s)
+
+
+TIME_WINDOW_MAPPINGS: List[Tuple[List[str], int, str]] = [
+    (["next week", "coming week", "upcoming week"], 7, "the next 7 days"),
+    (["this weekend", "on the weekend"], 4, "this weekend"),
+    (["next weekend"], 7, "next weekend"),
+    (["today", "tonight"], 1, "today"),
+    (["tomorrow"], 2, "tomorrow (and the following day)"),
+    (["next month"], 31, "the next month"),
+    (["this month"], 31, "this month"),
+    (["soon", "coming up", "upcoming"], 14, "the next couple of weeks"),
+]
+
+# keyword -> index of its mapping (earlier mappings win)
+TIME_WINDOW_PRIORITY = {
+    kw: i for i, (keywords, _, _) in enumerate(TIME_WINDOW_MAPPINGS) for kw in keywords
+}
+
+# Zero-width lookahead tries every position; alternatives are in priority order
+TIME_WINDOW_PATTERN = re.compile(
+    "(?=(" + "|".join(re.escape(kw) for kw in TIME_WINDOW_PRIORITY) + "))"
+)
 
 
 def infer_time_window(question: str) -> Tuple[int | None, str]:
-    q = question.lower()
-    mappings = [
-        (["next week", "coming week", "upcoming week"], 7, "the next 7 days"),
-        (["this weekend", "on the weekend"], 4, "this weekend"),
-        (["next weekend"], 7, "next weekend"),
-        (["today", "tonight"], 1, "today"),
-        (["tomorrow"], 2, "tomorrow (and the following day)"),
-        (["next month"], 31, "the next month"),
-        (["this month"], 31, "this month"),
-        (["soon", "coming up", "upcoming"], 14, "the next couple of weeks"),
-    ]
-    for keywords, days, label in mappings:
-        if any(kw in q for kw in keywords):
-            return days, label
-    return None, "upcoming"
+    """`question` must already be lowercased."""
+    best = None
+    for m in TIME_WINDOW_PATTERN.finditer(question):
+        priority = TIME_WINDOW_PRIORITY[m.group(1)]
+        if best is None or priority < best:
+            best = priority
+            if best == 0:
+                break
+    if best is None:
+        return None, "upcoming"
+    _, days, label = TIME_WINDOW_MAPPINGS[best]
+    return days, label
+
+
+# /ask routing keywords by category
+QUESTION_KEYWORDS: Dict[str, List[str]] = {
+    "winner": ["winner", "winners", "who won", "who is the winner", "who are the winners"],
+    "event": ["hackathon", "hackathons", "event", "events", "competition", "game jam", "buildathon", "challenge"],
+    "intent": [
+        "show", "list", "find", "search", "browse", "recommend",
+        "upcoming", "next", "soon", "today", "tomorrow",
+        "this week", "next week", "this weekend", "next weekend",
+        "online", "remote", "virtual",
+    ],
+}
+
+QUESTION_KEYWORD_CATEGORY = {
+    kw: category for category, keywords in QUESTION_KEYWORDS.items() for kw in keywords
+}
+
+# Same lookahead trick as TIME_WINDOW_PATTERN: one pass finds every keyword hit
+QUESTION_KEYWORD_PATTERN = re.compile(
+    "(?=(" + "|".join(re.escape(kw) for kw in QUESTION_KEYWORD_CATEGORY) + "))"
+)
+
+
+def classify_question(question: str) -> Set[str]:
+    """Keyword categories present in an already-lowercased question."""
+    found = set()
+    for m in QUESTION_KEYWORD_PATTERN.finditer(question):
+        found.add(QUESTION_KEYWORD_CATEGORY[m.group(1)])
+        if len(found) == len(QUESTION_KEYWORDS):
+            break
+    return found
+
+# -------------------------------------------------
+# 7.4) CHANNEL INDEX (name -> channel id, per guild)
+# -------------------------------------------------
+# Ids rather than channel objects: guild.get_channel is a dict lookup into
+# discord.py's own cache, so we always hand back the live channel.
+_channel_index: Dict[int, Dict[str, int]] = {}
+
+
+def index_guild_channels(guild: discord.Guild) -> Dict[str, int]:
+    index: Dict[str, int] = {}
+    for ch in guild.text_channels:
+        # First match wins, same as discord.utils.get
+        index.setdefault(ch.name, ch.id)
+    _channel_index[guild.id] = index
+    return index
+
+
+def invalidate_channel_index(guild: discord.Guild) -> None:
+    _channel_index.pop(guild.id, None)
+
+
+def get_text_channel(guild: discord.Guild, name: str) -> discord.TextChannel | None:
+    index = _channel_index.get(guild.id)
+    if index is None:
+        index = index_guild_channels(guild)
+    channel_id = index.get(name)
+    if channel_id is None:
+        return None
+    channel = guild.get_channel(channel_id)
+    if isinstance(channel, discord.TextChannel) and channel.name == name:
+        return channel
+    # Stale id (deleted or renamed, and we missed the event): rebuild once by name
+    channel_id = index_guild_channels(guild).get(name)
+    channel = guild.get_channel(channel_id) if channel_id is not None else None
+    return channel if isinstance(channel, discord.TextChannel) else None
 
 # -------------------------------------------------
 # 7.5) ANNOUNCEMENT BROADCAST 
@@ -381,17 +691,25 @@ async def broadcast_announcement(message: discord.Message) -> None:
 
     original_embeds = message.embeds[:3] if message.embeds else []
 
-    sent_count = 0
+    async def send_to(channel: discord.TextChannel) -> bool:
+        # Sends within one channel stay ordered; channels run concurrently
+        try:
+            await channel.send(embed=embed)
+            for orig_embed in original_embeds:
+                await channel.send(embed=orig_embed)
+            return True
+        except Exception as e:
+            log.warning("Error broadcasting to %s: %s", channel.name, e)
+            return False
+
+    targets = []
     for channel_name in BROADCAST_CHANNELS:
-        channel = discord.utils.get(guild.text_channels, name=channel_name)
+        channel = get_text_channel(guild, channel_name)
         if channel and channel.id != message.channel.id:
-            try:
-                await channel.send(embed=embed)
-                for orig_embed in original_embeds:
-                    await channel.send(embed=orig_embed)
-                sent_count += 1
-            except Exception as e:
-                log.warning("Error broadcasting to %s: %s", channel_name, e)
+            targets.append(channel)
+
+    results = await asyncio.gather(*(send_to(ch) for ch in targets))
+    sent_count = sum(results)
 
     try:
         await message.add_reaction("📡")
@@ -403,57 +721,130 @@ async def broadcast_announcement(message: discord.Message) -> None:
 # -------------------------------------------------
 # 8) BOT STATE MANAGER
 # -------------------------------------------------
-@dataclass
+def _write_bytes_atomic(path: str, payload: bytes) -> None:
+    """Write to a temp file and swap it in, so a crash never leaves a torn file."""
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(payload)
+    os.replace(tmp_path, path)
+
+
+def _write_bytes_if_changed(path: str, payload: bytes) -> bool:
+    """Atomic write that skips files whose current contents already equal `payload`."""
+    try:
+        with open(path, "rb") as f:
+            if f.read() == payload:
+                return False
+    except FileNotFoundError:
+        pass
+    _write_bytes_atomic(path, payload)
+    return True
+
+
+# One lock per path: writers of the same file share its .tmp sibling
+_write_locks: Dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+
+
+async def write_json_if_changed(path: str, data) -> bool:
+    """Serialize `data` and write it unless the file on disk already matches.
+
+    The single write path for every JSON file the bot owns.
+    """
+    payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    async with _write_locks[path]:
+        # One worker-thread hop for read + compare + write + replace
+        write = asyncio.ensure_future(asyncio.to_thread(_write_bytes_if_changed, path, payload))
+        try:
+            return await asyncio.shield(write)
+        except asyncio.CancelledError:
+            # The thread can't be stopped: hold the lock until it is done so a
+            # later writer (e.g. the shutdown flush) never shares the .tmp file
+            try:
+                await write
+            except Exception:
+                pass
+            raise
+
+
+@dataclass(slots=True)
 class BotState:
     winners: Dict[str, dict] = field(default_factory=dict)
+    # lowercased hackathon name -> winners key, for /ask matching
+    _winners_lower: Dict[str, str] = field(default_factory=dict)
     strikes: Dict[str, int] = field(default_factory=dict)
-    last_hackathons: List[dict] = field(default_factory=list)
-    recent_joins: Dict[int, deque] = field(default_factory=lambda: defaultdict(
-        lambda: deque(maxlen=RAID_JOIN_THRESHOLD * 3)
-    ))
+    # URLs already seen by auto alerts, least recently seen first
+    last_hackathon_urls: OrderedDict[str, None] = field(default_factory=OrderedDict)
+    # guild id -> ascending monotonic join timestamps
+    recent_joins: Dict[int, List[float]] = field(default_factory=lambda: defaultdict(list))
     _lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    _dirty: asyncio.Event = field(default_factory=asyncio.Event)
+    _flush_now: asyncio.Event = field(default_factory=asyncio.Event)
+    _pending_changes: int = 0
+    _winners_dirty: bool = False
+    # Bumped on every winners change so views built from them know when to rebuild
+    winners_version: int = 0
+    _strikes_dirty: bool = False
 
     async def load_winners(self) -> None:
         if not os.path.exists(WINNERS_FILE):
             return
         try:
-            async with aiofiles.open(WINNERS_FILE, "r", encoding="utf-8") as f:
-                self.winners = json.loads(await f.read())
+            async with aiofiles.open(WINNERS_FILE, "rb") as f:
+                self.winners = orjson.loads(await f.read())
             log.info("Loaded %d winners from %s", len(self.winners), WINNERS_FILE)
         except Exception as e:
             log.warning("Could not load winners: %s", e)
             self.winners = {}
+        # One-time cleanup of placeholder entries saved before set-time validation
+        bad = [k for k, v in self.winners.items() if not is_valid_hackathon_name(v.get("hackathon", ""))]
+        if bad:
+            for k in bad:
+                del self.winners[k]
+            log.info("Dropped %d placeholder winner entries", len(bad))
+            self._winners_dirty = True
+            self._mark_dirty()
+        self.winners_version += 1
+        self._winners_lower = {}
+        for name in self.winners:
+            self._winners_lower.setdefault(name.lower(), name)
 
     async def save_winners(self) -> None:
         async with self._lock:
             snapshot = dict(self.winners)
         try:
-            async with aiofiles.open(WINNERS_FILE, "w", encoding="utf-8") as f:
-                await f.write(json.dumps(snapshot, indent=2, ensure_ascii=False))
-            log.info("Saved %d winners to %s", len(snapshot), WINNERS_FILE)
+            if await write_json_if_changed(WINNERS_FILE, snapshot):
+                log.info("Saved %d winners to %s", len(snapshot), WINNERS_FILE)
         except Exception as e:
             log.warning("Could not save winners: %s", e)
 
     async def set_winner(self, hackathon: str, data: dict) -> None:
         async with self._lock:
             self.winners[hackathon] = data
-        await self.save_winners()
+            self._winners_lower.setdefault(hackathon.lower(), hackathon)
+            self.winners_version += 1
+        self._winners_dirty = True
+        self._mark_dirty()
 
     def get_winner(self, hackathon: str) -> dict | None:
         return self.winners.get(hackathon)
 
-    def get_valid_winners(self) -> List[dict]:
-        return [
-            v for v in self.winners.values()
-            if v.get("hackathon", "").strip().lower() not in ("winner", "winners")
-        ]
+    def find_winner(self, lower_q: str) -> dict | None:
+        """First winner whose name appears in (or contains) the lowercased question."""
+        for name_lower, name in self._winners_lower.items():
+            if name_lower in lower_q or lower_q in name_lower:
+                return self.winners[name]
+        return None
+
+    def get_recent_winners(self, limit: int) -> List[dict]:
+        """Up to `limit` winners, newest first (walks back from the end of the dict)."""
+        return list(itertools.islice(reversed(self.winners.values()), limit))
 
     async def load_strikes(self) -> None:
         if not os.path.exists(STRIKES_FILE):
             return
         try:
-            async with aiofiles.open(STRIKES_FILE, "r", encoding="utf-8") as f:
-                self.strikes = json.loads(await f.read())
+            async with aiofiles.open(STRIKES_FILE, "rb") as f:
+                self.strikes = orjson.loads(await f.read())
             log.info("Loaded %d strikes from %s", len(self.strikes), STRIKES_FILE)
         except Exception as e:
             log.warning("Could not load strikes: %s", e)
@@ -463,35 +854,80 @@ class BotState:
         async with self._lock:
             snapshot = dict(self.strikes)
         try:
-            async with aiofiles.open(STRIKES_FILE, "w", encoding="utf-8") as f:
-                await f.write(json.dumps(snapshot, indent=2, ensure_ascii=False))
-            log.info("Saved %d strikes to %s", len(snapshot), STRIKES_FILE)
+            if await write_json_if_changed(STRIKES_FILE, snapshot):
+                log.info("Saved %d strikes to %s", len(snapshot), STRIKES_FILE)
         except Exception as e:
             log.warning("Could not save strikes: %s", e)
 
-    async def add_strike(self, guild_id: int, user_id: int, reason: str) -> int:
+    def add_strike(self, guild_id: int, user_id: int, reason: str) -> int:
+        # In-memory only; flush_loop persists it, so callers never wait on disk
         key = f"{guild_id}:{user_id}"
-        async with self._lock:
-            self.strikes[key] = self.strikes.get(key, 0) + 1
-            total = self.strikes[key]
+        total = self.strikes.get(key, 0) + 1
+        self.strikes[key] = total
         log.info("Strike added: user %d in guild %d (total %d) — reason: %s",
                  user_id, guild_id, total, reason)
-        await self.save_strikes()
+        self._strikes_dirty = True
+        self._mark_dirty()
         return total
 
     def get_strikes(self, guild_id: int, user_id: int) -> int:
         return self.strikes.get(f"{guild_id}:{user_id}", 0)
 
+    def _mark_dirty(self) -> None:
+        self._dirty.set()
+        self._pending_changes += 1
+        if self._pending_changes >= PERSIST_MAX_PENDING:
+            self._flush_now.set()
+
+    async def flush(self) -> None:
+        """Write whichever of winners/strikes changed since the last flush."""
+        self._dirty.clear()
+        self._flush_now.clear()
+        self._pending_changes = 0
+        winners, self._winners_dirty = self._winners_dirty, False
+        strikes, self._strikes_dirty = self._strikes_dirty, False
+        try:
+            if winners:
+                await self.save_winners()
+            if strikes:
+                await self.save_strikes()
+        except asyncio.CancelledError:
+            # Interrupted mid-write: keep the flags so the shutdown flush retries
+            self._winners_dirty |= winners
+            self._strikes_dirty |= strikes
+            raise
+
+    async def flush_loop(self) -> None:
+        """Coalesce bursts of changes into one write per debounce window or PERSIST_MAX_PENDING changes."""
+        while True:
+            await self._dirty.wait()
+            try:
+                await asyncio.wait_for(self._flush_now.wait(), PERSIST_DEBOUNCE_SECONDS)
+            except asyncio.TimeoutError:
+                pass
+            await self.flush()
+
     def update_hackathons(self, hackathons: List[dict]) -> None:
-        self.last_hackathons = hackathons[:100]
+        seen = self.last_hackathon_urls
+        for e in hackathons:
+            url = (e.get("url") or "").strip()
+            if url:
+                seen[url] = None
+                seen.move_to_end(url)
+        while len(seen) > MAX_REMEMBERED_HACKATHON_URLS:
+            seen.popitem(last=False)
 
     def record_join(self, guild_id: int) -> int:
-        now = time.time()
-        dq = self.recent_joins[guild_id]
-        dq.append(now)
-        while dq and now - dq[0] > RAID_JOIN_WINDOW_SECONDS:
-            dq.popleft()
-        return len(dq)
+        now = time.monotonic()
+        joins = self.recent_joins[guild_id]
+        joins.append(now)
+        # Timestamps only grow, so the start of the window is a binary search
+        start = bisect.bisect_left(joins, now - RAID_JOIN_WINDOW_SECONDS)
+        if start > RAID_JOIN_THRESHOLD * 3:
+            # Drop expired entries in batches rather than on every join
+            del joins[:start]
+            start = 0
+        return len(joins) - start
 
 
 state = BotState()
@@ -503,13 +939,19 @@ class HTTPClientManager:
     def __init__(self):
         self._client: httpx.AsyncClient | None = None
         self._lock = asyncio.Lock()
+        # Response cache: request URL -> conditional-GET headers / parsed body / fetch time
+        self._validators: Dict[str, Dict[str, str]] = {}
+        self._bodies: Dict[str, object] = {}
+        self._fetched_at: Dict[str, float] = {}
 
     async def get_client(self) -> httpx.AsyncClient:
         async with self._lock:
             if self._client is None or self._client.is_closed:
                 self._client = httpx.AsyncClient(
                     timeout=httpx.Timeout(10.0, connect=5.0),
-                    limits=httpx.Limits(max_connections=20),
+                    # Few distinct hosts: keep their connections (and TLS sessions) warm
+                    limits=httpx.Limits(max_connections=20, max_keepalive_connections=4, keepalive_expiry=60.0),
+                    headers={"User-Agent": "pika-bot"},
                     follow_redirects=True,
                 )
         return self._client
@@ -520,22 +962,48 @@ class HTTPClientManager:
                 await self._client.aclose()
                 self._client = None
 
+    async def get_json(self, url: str, params: dict | None = None, max_age: float = 0):
+        """GET and parse JSON.
+
+        A body younger than `max_age` seconds is returned without a request;
+        older ones are revalidated with If-None-Match / If-Modified-Since.
+        """
+        key = str(httpx.URL(url, params=params))
+        cached = key in self._bodies
+        if cached and time.monotonic() - self._fetched_at[key] < max_age:
+            return self._bodies[key]
+
+        client = await self.get_client()
+        headers = self._validators.get(key, {}) if cached else {}
+        r = await client.get(url, params=params, headers=headers)
+        if r.status_code == 304 and cached:
+            self._fetched_at[key] = time.monotonic()
+            return self._bodies[key]
+        r.raise_for_status()
+
+        data = orjson.loads(r.content)
+        validators = {}
+        if etag := r.headers.get("ETag"):
+            validators["If-None-Match"] = etag
+        if last_modified := r.headers.get("Last-Modified"):
+            validators["If-Modified-Since"] = last_modified
+        self._validators[key] = validators
+        self._bodies[key] = data
+        self._fetched_at[key] = time.monotonic()
+        return data
+
 
 http_manager = HTTPClientManager()
 
 # -------------------------------------------------
 # 10) HACKATHONS FETCH + FILTERS
 # -------------------------------------------------
-async def fetch_hackathons() -> List[dict]:
-    client = await http_manager.get_client()
-
+async def fetch_hackathons(max_age: float = FEED_CACHE_TTL_SECONDS) -> List[dict]:
     base = (HACKATHONS_API_BASE or "").strip()
     if base:
         url = base.rstrip("/") + "/hackathons/upcoming"
         try:
-            r = await client.get(url, params={"days": 365, "limit": 300})
-            r.raise_for_status()
-            data = r.json()
+            data = await http_manager.get_json(url, params={"days": 365, "limit": 300}, max_age=max_age)
 
             if isinstance(data, dict) and "events" in data:
                 events = data["events"]
@@ -552,9 +1020,7 @@ async def fetch_hackathons() -> List[dict]:
             log.warning("Could not fetch hackathons from Insights API: %s", e)
 
     try:
-        r = await client.get(HACKATHONS_JSON_URL)
-        r.raise_for_status()
-        data = r.json()
+        data = await http_manager.get_json(HACKATHONS_JSON_URL, max_age=max_age)
         if isinstance(data, list):
             log.info("Fetched %d hackathons from GitHub JSON fallback", len(data))
             return data
@@ -574,18 +1040,15 @@ def filter_events_with_dates(events: List[dict]) -> List[dict]:
 
 
 def sort_events_by_date(events: List[dict]) -> List[Tuple[dict, datetime | None]]:
-    events_with_dates: List[Tuple[dict, datetime | None]] = []
-    for e in events:
+    # Sort keys are computed once per event; the index keeps the sort stable
+    # and guarantees tuple comparison never falls through to the dicts.
+    keyed = []
+    for i, e in enumerate(events):
         dt = parse_iso_date(e.get("start_date") or "")
-        events_with_dates.append((e, dt))
+        keyed.append((dt.timestamp() if dt is not None else float("inf"), i, e, dt))
 
-    events_with_dates.sort(
-        key=lambda pair: (
-            0 if pair[1] is not None else 1,
-            pair[1].timestamp() if pair[1] is not None else float("inf"),
-        )
-    )
-    return events_with_dates
+    keyed.sort()
+    return [(e, dt) for _, _, e, dt in keyed]
 
 
 def filter_events_for_question(
@@ -610,9 +1073,10 @@ def filter_events_for_question(
     )
 
     now = datetime.now(timezone.utc)
-    filtered: List[Tuple[dict, datetime | None]] = []
+    end = now + timedelta(days=window_days) if window_days is not None else None
+    keyed = []
 
-    for e in events:
+    for i, e in enumerate(events):
         source = (e.get("source") or "").strip().lower()
         if only_hackeroos and source != "hackeroos":
             continue
@@ -620,22 +1084,22 @@ def filter_events_for_question(
             continue
 
         dt = parse_iso_date(e.get("start_date"))
-        if window_days is not None:
+        if end is not None:
             if dt is None:
                 continue
-            end = now + timedelta(days=window_days)
             if not (now <= dt <= end):
                 continue
 
-        filtered.append((e, dt))
+        keyed.append((
+            dt.timestamp() if dt is not None else float("inf"),
+            (e.get("title") or "").lower(),
+            i,
+            e,
+            dt,
+        ))
 
-    filtered.sort(
-        key=lambda pair: (
-            0 if pair[1] is not None else 1,
-            pair[1].timestamp() if pair[1] is not None else float("inf"),
-            (pair[0].get("title") or "").lower(),
-        )
-    )
+    keyed.sort()
+    filtered = [(e, dt) for _, _, _, e, dt in keyed]
 
     return filtered, window_label
 
@@ -662,7 +1126,10 @@ async def pin_and_unpin(message: discord.Message, bot_user: discord.User) -> Non
 async def get_mod_log_channel(guild: discord.Guild) -> discord.TextChannel | None:
     if guild is None:
         return None
-    return discord.utils.get(guild.text_channels, name=MOD_LOG_CHANNEL_NAME)
+    return get_text_channel(guild, MOD_LOG_CHANNEL_NAME)
+
+
+_mod_log_queue: asyncio.Queue = asyncio.Queue(maxsize=MOD_LOG_QUEUE_SIZE)
 
 
 async def send_mod_log(
@@ -695,12 +1162,97 @@ async def send_mod_log(
 
     embed.set_footer(text="Pika-Bot • Moderation Log")
 
+    # Handlers only enqueue; mod_log_writer does the HTTP round-trips.
+    # The embed already holds plain strings, so only the channel id is kept
+    # (no Member / Guild objects pinned in the queue).
     try:
-        await chan.send(embed=embed)
+        _mod_log_queue.put_nowait((chan.id, embed))
+    except asyncio.QueueFull:
+        log.warning("Mod log queue full, dropping entry: %s", title)
+
+
+def _split_mod_log_batches(embeds: List[discord.Embed]) -> List[List[discord.Embed]]:
+    """Group embeds into messages within Discord's per-message embed count and size limits."""
+    batches: List[List[discord.Embed]] = []
+    current: List[discord.Embed] = []
+    size = 0
+    for embed in embeds:
+        n = len(embed)
+        if current and (len(current) >= MOD_LOG_BATCH_SIZE or size + n > MOD_LOG_BATCH_MAX_CHARS):
+            batches.append(current)
+            current, size = [], 0
+        current.append(embed)
+        size += n
+    if current:
+        batches.append(current)
+    return batches
+
+
+async def _send_mod_log_batch(chan_id: int, embeds: List[discord.Embed]) -> None:
+    chan = bot.get_channel(chan_id)
+    if chan is None:
+        return
+    try:
+        await chan.send(embeds=embeds)
+        return
     except discord.Forbidden:
-        pass
+        return
+    except discord.HTTPException as e:
+        if len(embeds) == 1:
+            log.warning("Could not send mod log: %s", e)
+            return
+        log.warning("Mod-log batch of %d rejected (%s); sending one at a time", len(embeds), e)
     except Exception as e:
         log.warning("Could not send mod log: %s", e)
+        return
+
+    for embed in embeds:
+        try:
+            await chan.send(embed=embed)
+        except discord.Forbidden:
+            return
+        except Exception as e:
+            log.warning("Could not send mod log: %s", e)
+
+
+async def mod_log_writer() -> None:
+    """Drain the mod-log queue, sending up to MOD_LOG_BATCH_SIZE embeds per message."""
+    loop = asyncio.get_running_loop()
+    while True:
+        chan_id, embed = await _mod_log_queue.get()
+        batches: Dict[int, List[discord.Embed]] = {chan_id: [embed]}
+        taken = 1
+
+        # Collect whatever else arrives within the window, until one channel fills up
+        deadline = loop.time() + MOD_LOG_FLUSH_SECONDS
+        while len(batches[chan_id]) < MOD_LOG_BATCH_SIZE:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                chan_id, embed = await asyncio.wait_for(_mod_log_queue.get(), timeout)
+            except asyncio.TimeoutError:
+                break
+            batches.setdefault(chan_id, []).append(embed)
+            taken += 1
+
+        try:
+            await asyncio.gather(*(
+                _send_mod_log_batch(chan_id, batch)
+                for chan_id, embeds in batches.items()
+                for batch in _split_mod_log_batches(embeds)
+            ))
+        finally:
+            for _ in range(taken):
+                _mod_log_queue.task_done()
+
+
+async def drain_mod_log() -> None:
+    """Wait (bounded) for queued mod-log entries to go out before disconnecting."""
+    try:
+        await asyncio.wait_for(_mod_log_queue.join(), MOD_LOG_DRAIN_TIMEOUT_SECONDS)
+    except asyncio.TimeoutError:
+        log.warning("Mod log drain timed out with %d entries left", _mod_log_queue.qsize())
 
 # -------------------------------------------------
 # 13) RAID DETECTION (safe bot member lookup)
@@ -779,6 +1331,8 @@ _background_tasks: List[asyncio.Task] = []
 async def shutdown() -> None:
     log.info("Shutting down… cancelling tasks + closing HTTP client")
 
+    auto_alerts_loop.cancel()
+
     for task in _background_tasks:
         if not task.done():
             task.cancel()
@@ -787,125 +1341,146 @@ async def shutdown() -> None:
             except asyncio.CancelledError:
                 pass
 
+    await state.flush()
     await http_manager.close()
+    if _hf_client is not None:
+        await _hf_client.close()
     log.info("Cleanup complete.")
 
 # -------------------------------------------------
 # 16) BACKGROUND LOOPS
 # -------------------------------------------------
-async def auto_alerts_loop() -> None:
-    await bot.wait_until_ready()
-    log.info("Auto-alerts loop started (every %d hours)", AUTO_ALERT_INTERVAL_HOURS)
+async def run_auto_alerts() -> None:
+    """One auto-alert cycle: fetch, diff against the last run, post anything new."""
+    events = await fetch_hackathons()
+    if not events:
+        log.warning("Hackathons feed empty or unreachable")
+        return
 
-    failure_count = 0
+    online_events = filter_online_events(events)
+    if not online_events:
+        log.info("No online-only hackathons found this cycle.")
+        return
 
-    while not bot.is_closed():
-        try:
-            events = await fetch_hackathons()
-            if not events:
-                log.warning("Hackathons feed empty or unreachable")
-                await asyncio.sleep(AUTO_ALERT_INTERVAL_HOURS * 60 * 60)
-                continue
+    if not state.last_hackathon_urls:
+        state.update_hackathons(online_events)
+        log.info("First run: cached %d online hackathons", len(online_events))
+        return
 
-            online_events = filter_online_events(events)
-            if not online_events:
-                log.info("No online-only hackathons found this cycle.")
-                await asyncio.sleep(AUTO_ALERT_INTERVAL_HOURS * 60 * 60)
-                continue
+    # (event, url, start) pulled out once; compared against the cached url set
+    old_urls = state.last_hackathon_urls
+    new_events = []
+    for e in online_events:
+        url = (e.get("url") or "").strip()
+        if not url or url in old_urls:
+            continue
+        raw_start = (e.get("start_date") or "").strip()
+        if raw_start:
+            new_events.append((e, url, raw_start))
 
-            if not state.last_hackathons:
-                state.update_hackathons(online_events)
-                log.info("First run: cached %d online hackathons", len(online_events))
-                await asyncio.sleep(AUTO_ALERT_INTERVAL_HOURS * 60 * 60)
-                continue
+    if new_events:
+        log.info("New ONLINE hackathons detected: %d", len(new_events))
 
-            old_urls = {e.get("url") for e in state.last_hackathons if e.get("url")}
-            new_events = [
-                e for e in online_events
-                if e.get("url") and e["url"] not in old_urls and has_valid_date(e)
-            ]
-
-            if new_events:
-                log.info("New ONLINE hackathons detected: %d", len(new_events))
-
-                for guild in bot.guilds:
-                    channel = discord.utils.get(guild.text_channels, name=HACKATHON_CHANNEL_NAME)
-                    if not channel:
-                        continue
-
-                    embed = discord.Embed(
-                        title="New Online Global Hackathons 🌍",
-                        description=(
-                            f"{len(new_events)} new **online** global event(s) just dropped!\n\n"
-                            "These are *not* Hackeroos-run events.\n"
-                            "For official Hackeroos things, check #announcements. 🦘"
-                        ),
-                        color=0x00ff88,
-                        timestamp=datetime.now(timezone.utc),
-                    )
+        # Same embed for every guild: build it (and parse dates) once
+        embed = discord.Embed(
+            title="New Online Global Hackathons 🌍",
+            description=(
+                f"{len(new_events)} new **online** global event(s) just dropped!\n\n"
+                "These are *not* Hackeroos-run events.\n"
+                "For official Hackeroos things, check #announcements. 🦘"
+            ),
+            color=0x00ff88,
+            timestamp=datetime.now(timezone.utc),
+        )
 
-                    for e in new_events[:MAX_EVENTS_IN_EMBED]:
-                        title = (e.get("title") or "Untitled")[:80]
-                        source = e.get("source", "Unknown")
-                        loc = e.get("location") or "Online"
-                        dt = parse_iso_date(e.get("start_date") or "")
-                        start = dt.strftime("%Y-%m-%d") if dt else "Date coming soon"
-                        url = e.get("url", "#")
-                        embed.add_field(
-                            name=f"{source} · {title}",
-                            value=f"{loc} • {start} • [Register]({url})",
-                            inline=False,
-                        )
-
-                    embed.set_footer(text="Pika-Bot • Auto-updated (online-only) from Insights/GitHub")
-                    await channel.send(embed=embed)
-            else:
-                log.info("No new online hackathons this cycle")
+        for e, url, raw_start in new_events[:MAX_EVENTS_IN_EMBED]:
+            title = (e.get("title") or "Untitled")[:80]
+            source = e.get("source", "Unknown")
+            loc = e.get("location") or "Online"
+            dt = parse_iso_date(raw_start)
+            start = dt.strftime("%Y-%m-%d") if dt else "Date coming soon"
+            embed.add_field(
+                name=f"{source} · {title}",
+                value=f"{loc} • {start} • [Register]({url})",
+                inline=False,
+            )
 
-            state.update_hackathons(online_events)
-            failure_count = 0
+        embed.set_footer(text="Pika-Bot • Auto-updated (online-only) from Insights/GitHub")
 
-        except asyncio.CancelledError:
-            log.info("auto_alerts_loop cancelled gracefully")
-            raise
-        except httpx.RequestError as e:
-            failure_count += 1
-            log.warning("Network error in auto_alerts_loop (%d/%d): %s",
-                        failure_count, MAX_CONSECUTIVE_FAILURES, e)
-            if failure_count >= MAX_CONSECUTIVE_FAILURES:
-                log.error("Too many consecutive failures, pausing loop")
-                await asyncio.sleep(RAID_BACKOFF_SECONDS)
-                failure_count = 0
-        except Exception as e:
-            log.exception("auto_alerts_loop crashed: %s", e)
+        channels = []
+        for guild in bot.guilds:
+            channel = get_text_channel(guild, HACKATHON_CHANNEL_NAME)
+            if channel:
+                channels.append(channel)
 
-        await asyncio.sleep(AUTO_ALERT_INTERVAL_HOURS * 60 * 60)
+        results = await asyncio.gather(
+            *(ch.send(embed=embed) for ch in channels),
+            return_exceptions=True,
+        )
+        for ch, result in zip(channels, results):
+            if isinstance(result, Exception):
+                log.warning("Could not post hackathon alert in %s: %s", ch.guild.name, result)
+    else:
+        log.info("No new online hackathons this cycle")
+
+    state.update_hackathons(online_events)
+
+
+_alert_failures = 0
+
+
+@tasks.loop(hours=AUTO_ALERT_INTERVAL_HOURS)
+async def auto_alerts_loop() -> None:
+    global _alert_failures
+    try:
+        await run_auto_alerts()
+        _alert_failures = 0
+    except httpx.RequestError as e:
+        _alert_failures += 1
+        log.warning("Network error in auto_alerts_loop (%d/%d): %s",
+                    _alert_failures, MAX_CONSECUTIVE_FAILURES, e)
+        if _alert_failures >= MAX_CONSECUTIVE_FAILURES:
+            log.error("Too many consecutive failures, pausing loop")
+            await asyncio.sleep(RAID_BACKOFF_SECONDS)
+            _alert_failures = 0
+    except Exception as e:
+        # Swallowed so one bad cycle doesn't stop the loop
+        log.exception("auto_alerts_loop crashed: %s", e)
+
+
+@auto_alerts_loop.before_loop
+async def before_auto_alerts() -> None:
+    await bot.wait_until_ready()
+    log.info("Auto-alerts loop started (every %d hours)", AUTO_ALERT_INTERVAL_HOURS)
 
 # -------------------------------------------------
 # 17) LIFECYCLE EVENTS
 # -------------------------------------------------
 @bot.event
 async def on_ready():
-    await state.load_winners()
-    await state.load_strikes()
-
     async with _bg_lock:
         if not getattr(bot, "_bg_tasks_started", False):
             bot._bg_tasks_started = True
-            task1 = asyncio.create_task(auto_alerts_loop())
-            _background_tasks.extend([task1])
+            # Load once: on a reconnect, memory may hold debounced changes not yet on disk
+            await state.load_winners()
+            await state.load_strikes()
+            auto_alerts_loop.start()
+            task1 = asyncio.create_task(state.flush_loop())
+            task2 = asyncio.create_task(mod_log_writer())
+            _background_tasks.extend([task1, task2])
             log.info("✅ Background loops started once.")
         else:
             log.info("ℹ️ on_ready fired again — background loops already running.")
 
     try:
         await bot.tree.sync()
+        invalidate_help_embed()
         log.info("Slash commands synced globally")
     except Exception as e:
         log.warning("Error syncing slash commands: %s", e)
 
     log.info("Pika-Bot online | Guilds: %d | Hackathons cached: %d",
-             len(bot.guilds), len(state.last_hackathons))
+             len(bot.guilds), len(state.last_hackathon_urls))
 
     await bot.change_presence(
         activity=discord.Game(name="Helping Hackeroos innovate ⚡🦘"),
@@ -916,24 +1491,48 @@ async def on_ready():
     # If needed, we can persist it to a JSON file per guild.
 
 
+@bot.event
+async def on_guild_available(guild: discord.Guild):
+    index_guild_channels(guild)
+
+
+@bot.event
+async def on_guild_join(guild: discord.Guild):
+    index_guild_channels(guild)
+
+
+@bot.event
+async def on_guild_remove(guild: discord.Guild):
+    invalidate_channel_index(guild)
+
+
+@bot.event
+async def on_guild_channel_create(channel: discord.abc.GuildChannel):
+    invalidate_channel_index(channel.guild)
+
+
+@bot.event
+async def on_guild_channel_delete(channel: discord.abc.GuildChannel):
+    invalidate_channel_index(channel.guild)
+
+
+@bot.event
+async def on_guild_channel_update(before: discord.abc.GuildChannel, after: discord.abc.GuildChannel):
+    invalidate_channel_index(after.guild)
+
+
 @bot.event
 async def on_member_join(member: discord.Member):
     await handle_possible_raid(member, bot.user)
 
     try:
-        await member.send(
-            f"Welcome to Hackeroos, {member.name}! 🦘💛\n"
-            f"I'm **Pika-Bot**. Use `/pika-help` in the server to see what I can do.\n"
-            f"To unlock channels, run `/verify` in #{WELCOME_CHANNEL_NAME}."
-        )
+        await member.send(WELCOME_DM_TEMPLATE.format(name=member.name))
     except discord.Forbidden:
         log.warning("Could not DM %s", member.name)
 
-    channel = discord.utils.get(member.guild.text_channels, name=WELCOME_CHANNEL_NAME)
+    channel = get_text_channel(member.guild, WELCOME_CHANNEL_NAME)
     if channel:
-        await channel.send(
-            f"⚡ G'day {member.mention}! Welcome to **{member.guild.name}** — run `/verify` to get access!"
-        )
+        await channel.send(WELCOME_CHANNEL_TEMPLATE.format(mention=member.mention, guild=member.guild.name))
 
     await send_mod_log(
         member.guild,
@@ -1007,11 +1606,18 @@ async def on_message(message: discord.Message):
     # Mirror any #announcements post as an embed into broadcast channels
     await broadcast_announcement(message)
 
+    content = message.content or ""
+    if len(content) < SHORT_MESSAGE_LENGTH and content.isascii():
+        await bot.process_commands(message)
+        return
+
     guild = message.guild
     author = message.author
-    is_admin = author.guild_permissions.administrator or author.guild_permissions.manage_guild
+    # guild_permissions rebuilds a Permissions object from the member's roles on each access
+    perms = author.guild_permissions
+    is_admin = perms.administrator or perms.manage_guild
 
-    if contains_blocked_word(message.content or ""):
+    if contains_blocked_word(content):
         try:
             await message.delete()
         except discord.Forbidden:
@@ -1023,11 +1629,11 @@ async def on_message(message: discord.Message):
             "Message Deleted (Bad Word Filter)",
             user=author,
             channel=message.channel,
-            extra={"Content": (message.content or "")[:512]},
+            extra={"Content": content[:512]},
         )
         return
 
-    if not is_admin:
+    if not is_admin and (message.mentions or message.mention_everyone or message.role_mentions):
         mention_count = len(message.mentions)
         if message.mention_everyone:
             mention_count += 5
@@ -1040,7 +1646,7 @@ async def on_message(message: discord.Message):
             except discord.Forbidden:
                 pass
 
-            strikes = await state.add_strike(guild.id, author.id, reason=f"Mention spam ({mention_count} mentions)")
+            strikes = state.add_strike(guild.id, author.id, reason=f"Mention spam ({mention_count} mentions)")
             await send_mod_log(
                 guild,
                 "Mention Spam Detected",
@@ -1048,7 +1654,7 @@ async def on_message(message: discord.Message):
                 channel=message.channel,
                 extra={
                     "Mentions": mention_count,
-                    "Message": (message.content or "")[:512],
+                    "Message": content[:512],
                     "Strikes (after)": strikes,
                 },
             )
@@ -1070,23 +1676,27 @@ async def on_message(message: discord.Message):
                     pass
             return
 
-    if not is_admin and message.content:
-        emoji_count = len(EMOJI_PATTERN.findall(message.content))
+    # Each emoji run needs at least one character, so short messages can't trip the threshold
+    if not is_admin and len(content) >= EMOJI_SPAM_THRESHOLD:
+        # One past the threshold tells "exactly at it" apart from "scan cut short"
+        emoji_limit = EMOJI_SPAM_THRESHOLD + 1
+        emoji_count = count_emojis(content, limit=emoji_limit)
         if emoji_count >= EMOJI_SPAM_THRESHOLD:
+            emoji_label = f"{emoji_count}+" if emoji_count == emoji_limit else str(emoji_count)
             try:
                 await message.delete()
             except discord.Forbidden:
                 pass
 
-            strikes = await state.add_strike(guild.id, author.id, reason=f"Emoji spam ({emoji_count} emojis)")
+            strikes = state.add_strike(guild.id, author.id, reason=f"Emoji spam ({emoji_label} emojis)")
             await send_mod_log(
                 guild,
                 "Emoji Spam Detected",
                 user=author,
                 channel=message.channel,
                 extra={
-                    "Emoji count": emoji_count,
-                    "Message": (message.content or "")[:512],
+                    "Emoji count": emoji_label,
+                    "Message": content[:512],
                     "Strikes (after)": strikes,
                 },
             )
@@ -1108,11 +1718,11 @@ async def on_message(message: discord.Message):
                     pass
             return
 
-    lowered = (message.content or "").lower()
+    # Cheap channel / permission checks first; only then search the content
     if (
         message.channel.name == ANNOUNCEMENTS_CHANNEL_NAME
-        and message.author.guild_permissions.administrator
-        and "winner" in lowered
+        and perms.administrator
+        and WINNER_TRIGGER_PATTERN.search(content)
     ):
         await handle_winner_announcement(message)
         return
@@ -1127,7 +1737,7 @@ async def handle_winner_announcement(message: discord.Message) -> None:
     if match:
         raw_hackathon = (match.group("hackathon") or "")
         cleaned_hackathon = strip_emojis(raw_hackathon)
-        cleaned_hackathon = cleaned_hackathon.replace("-", "").replace("–", "").replace(":", "").strip()
+        cleaned_hackathon = cleaned_hackathon.translate(WINNER_PUNCT_TRANSLATION).strip()
 
         if cleaned_hackathon and len(cleaned_hackathon) >= 3:
             hackathon = cleaned_hackathon
@@ -1141,8 +1751,8 @@ async def handle_winner_announcement(message: discord.Message) -> None:
         lines = [ln for ln in message.content.splitlines() if ln.strip()]
         if lines:
             first_clean = strip_emojis(lines[0])
-            first_clean = re.sub(r"(?i)\b(winner|winners)\b", "", first_clean)
-            first_clean = first_clean.replace("-", "").replace("–", "").replace(":", "").strip()
+            first_clean = WINNER_WORD_PATTERN.sub("", first_clean)
+            first_clean = first_clean.translate(WINNER_PUNCT_TRANSLATION).strip()
 
             if not first_clean and len(lines) >= 2:
                 candidate = strip_emojis(lines[1]).strip()
@@ -1153,7 +1763,7 @@ async def handle_winner_announcement(message: discord.Message) -> None:
                 hackathon = first_clean
                 team = project = prize = "—"
 
-    if hackathon:
+    if hackathon and is_valid_hackathon_name(hackathon):
         existing = state.get_winner(hackathon) or {}
         await state.set_winner(hackathon, {
             "hackathon": hackathon,
@@ -1177,17 +1787,57 @@ async def handle_winner_announcement(message: discord.Message) -> None:
 # -------------------------------------------------
 # 18) SLASH COMMANDS
 # -------------------------------------------------
+def _require_guild(interaction: discord.Interaction) -> bool:
+    # DM interactions carry empty permissions, so without this has_permissions
+    # would report MissingPermissions; innermost check, so it runs first
+    if interaction.guild is None:
+        raise app_commands.NoPrivateMessage()
+    return True
+
+
+@bot.tree.error
+async def on_app_command_error(interaction: discord.Interaction, error: app_commands.AppCommandError):
+    name = interaction.command.name if interaction.command else "this command"
+    if isinstance(error, app_commands.NoPrivateMessage):
+        message = f"⚠️ Please use `/{name}` in a server, not in DMs."
+    elif isinstance(error, app_commands.MissingPermissions):
+        message = f"⚠️ Only admins can use `/{name}`."
+    else:
+        log.error("Error in /%s", name, exc_info=error)
+        return
+    if interaction.response.is_done():
+        await interaction.followup.send(message, ephemeral=True)
+    else:
+        await interaction.response.send_message(message, ephemeral=True)
+
+
+# /pika-help lists the command tree, so it is rebuilt lazily after each sync
+_help_embed: discord.Embed | None = None
+
+
+def invalidate_help_embed() -> None:
+    global _help_embed
+    _help_embed = None
+
+
+def get_help_embed() -> discord.Embed:
+    global _help_embed
+    if _help_embed is None:
+        embed = discord.Embed(
+            title="Pika-Bot — Hackeroos Helper",
+            description="Slash commands currently available:",
+            color=0xffc300
+        )
+        for cmd in bot.tree.get_commands():
+            embed.add_field(name=f"/{cmd.name}", value=(cmd.description or "No description"), inline=False)
+        embed.set_footer(text="Built by Pika-Bots (AIHE Group 19)")
+        _help_embed = embed
+    return _help_embed
+
+
 @bot.tree.command(name="pika-help", description="Show all Pika-Bot slash commands 🦘")
 async def pika_help(interaction: discord.Interaction):
-    embed = discord.Embed(
-        title="Pika-Bot — Hackeroos Helper",
-        description="Slash commands currently available:",
-        color=0xffc300
-    )
-    for cmd in bot.tree.get_commands():
-        embed.add_field(name=f"/{cmd.name}", value=(cmd.description or "No description"), inline=False)
-    embed.set_footer(text="Built by Pika-Bots (AIHE Group 19)")
-    await interaction.response.send_message(embed=embed, ephemeral=True)
+    await interaction.response.send_message(embed=get_help_embed(), ephemeral=True)
 
 
 @bot.tree.command(name="hello", description="Say g'day to Pika-Bot")
@@ -1274,6 +1924,8 @@ async def poll(interaction: discord.Interaction, question: str):
     await interaction.response.send_message("Poll created ✅", ephemeral=True)
 
 
+# Only a handful of fixed (title, description) pairs; the embeds are sent, never mutated
+@functools.lru_cache(maxsize=8)
 def create_fallback_hackathons_embed(title: str, description: str) -> discord.Embed:
     embed = discord.Embed(
         title=title,
@@ -1373,8 +2025,7 @@ async def hackathons_cmd(interaction: discord.Interaction):
     await interaction.followup.send(embed=embed)
 
 
-@bot.tree.command(name="faq", description="Common questions about Hackeroos / Pika-Bot")
-async def faq(interaction: discord.Interaction):
+def build_faq_embed() -> discord.Embed:
     embed = discord.Embed(title="Hackeroos FAQ", description="Quick answers for new members:", color=0x3b82f6)
     embed.add_field(name="1. I just joined, what now?",
                     value=f"Go to **#{WELCOME_CHANNEL_NAME}** and run `/verify` to unlock channels.",
@@ -1386,7 +2037,16 @@ async def faq(interaction: discord.Interaction):
     embed.add_field(name="6. Where can I follow Hackeroos?",
                     value="X: https://x.com/hackeroos_au\nWeb: https://www.hackeroos.com.au/",
                     inline=False)
-    await interaction.response.send_message(embed=embed, ephemeral=True)
+    return embed
+
+
+# Static content: built once, sent as-is on every /faq
+FAQ_EMBED = build_faq_embed()
+
+
+@bot.tree.command(name="faq", description="Common questions about Hackeroos / Pika-Bot")
+async def faq(interaction: discord.Interaction):
+    await interaction.response.send_message(embed=FAQ_EMBED, ephemeral=True)
 
 
 @bot.tree.command(name="status", description="Bot health check")
@@ -1406,29 +2066,22 @@ async def ask(interaction: discord.Interaction, question: str):
         await interaction.followup.send("⚠️ Please provide a question.", ephemeral=True)
         return
 
-    if await handle_winner_question(interaction, question):
+    categories = classify_question(question.lower())
+    if await handle_winner_question(interaction, question, categories):
         return
-    if await handle_event_question(interaction, question):
+    if await handle_event_question(interaction, question, categories):
         return
     await handle_llm_question(interaction, question)
 
 
-async def handle_winner_question(interaction: discord.Interaction, question: str) -> bool:
-    lower_q = question.lower()
-    winner_keywords = ["winner", "winners", "who won", "who is the winner", "who are the winners"]
-
-    if not any(k in lower_q for k in winner_keywords):
+async def handle_winner_question(interaction: discord.Interaction, question: str, categories: Set[str]) -> bool:
+    if "winner" not in categories:
         return False
+    lower_q = question.lower()
     if not state.winners:
         return False
 
-    matched = None
-    for name, data in state.winners.items():
-        name_lower = name.lower()
-        if name_lower in lower_q or lower_q in name_lower:
-            matched = data
-            break
-
+    matched = state.find_winner(lower_q)
     if matched:
         hackathon_name = matched.get("hackathon", "Unknown hackathon")
         source = matched.get("source")
@@ -1447,14 +2100,13 @@ async def handle_winner_question(interaction: discord.Interaction, question: str
         await interaction.followup.send(msg, ephemeral=True)
         return True
 
-    valid_entries = state.get_valid_winners()
-    if not valid_entries:
+    entries = state.get_recent_winners(RECENT_WINNERS_DISPLAY_COUNT)
+    if not entries:
         await interaction.followup.send("🏆 I don't have any valid winners saved yet.", ephemeral=True)
         return True
 
-    entries = valid_entries[-RECENT_WINNERS_DISPLAY_COUNT:]
     lines = ["Here are some recent Hackeroos winners I know about:\n"]
-    for item in reversed(entries):
+    for item in entries:
         hackathon_name = item.get("hackathon", "Unknown")
         source = item.get("source")
         if source == "announcement" and item.get("announcement_text"):
@@ -1471,21 +2123,8 @@ async def handle_winner_question(interaction: discord.Interaction, question: str
     return True
 
 
-async def handle_event_question(interaction: discord.Interaction, question: str) -> bool:
-    lower_q = question.lower()
-
-    event_keywords = ["hackathon", "hackathons", "event", "events", "competition", "game jam", "buildathon", "challenge"]
-    if not any(k in lower_q for k in event_keywords):
-        return False
-
-    intent_keywords = [
-        "show", "list", "find", "search", "browse", "recommend",
-        "upcoming", "next", "soon", "today", "tomorrow",
-        "this week", "next week", "this weekend", "next weekend",
-        "online", "remote", "virtual",
-    ]
-
-    if not any(k in lower_q for k in intent_keywords):
+async def handle_event_question(interaction: discord.Interaction, question: str, categories: Set[str]) -> bool:
+    if "event" not in categories or "intent" not in categories:
         return False
 
     events = await fetch_hackathons()
@@ -1528,6 +2167,30 @@ async def handle_event_question(interaction: discord.Interaction, question: str)
     return True
 
 
+_hf_client = None
+
+HF_SYSTEM_MESSAGE: Final[dict] = {
+    "role": "system",
+    "content": (
+        "You are Pika-Bot, a friendly Australian hackathon assistant for the "
+        "Hackeroos Discord community. Be concise, encouraging, and clear. "
+        "If the user asks about specific Hackeroos winners or upcoming events, "
+        "ask them to use the bot's commands instead: /winners and /hackathons."
+    ),
+}
+
+
+def get_hf_client():
+    """Shared async OpenAI-compatible client for the HF router (keeps its connection pool warm)."""
+    global _hf_client
+    if _hf_client is None:
+        # Imported on first use: openai pulls in pydantic and friends, and
+        # nothing outside /ask needs it
+        from openai import AsyncOpenAI
+        _hf_client = AsyncOpenAI(base_url="https://router.huggingface.co/v1", api_key=HF_TOKEN)
+    return _hf_client
+
+
 async def handle_llm_question(interaction: discord.Interaction, question: str) -> None:
     if not HF_TOKEN:
         await interaction.followup.send(
@@ -1538,24 +2201,18 @@ async def handle_llm_question(interaction: discord.Interaction, question: str) -
         return
 
     try:
-        client = OpenAI(base_url="https://router.huggingface.co/v1", api_key=HF_TOKEN)
-        completion = client.chat.completions.create(
+        client = get_hf_client()
+        completion = await asyncio.wait_for(client.chat.completions.create(
             model=HF_MODEL,
-            messages=[
-                {
-                    "role": "system",
-                    "content": (
-                        "You are Pika-Bot, a friendly Australian hackathon assistant for the "
-                        "Hackeroos Discord community. Be concise, encouraging, and clear. "
-                        "If the user asks about specific Hackeroos winners or upcoming events, "
-                        "ask them to use the bot's commands instead: /winners and /hackathons."
-                    ),
-                },
-                {"role": "user", "content": question},
-            ],
-        )
+            messages=[HF_SYSTEM_MESSAGE, {"role": "user", "content": question}],
+        ), timeout=HF_REQUEST_TIMEOUT_SECONDS)
         reply = completion.choices[0].message.content
         await interaction.followup.send(f"🦘 **Pika-Bot AI:** {reply}", ephemeral=True)
+    except asyncio.TimeoutError:
+        await interaction.followup.send(
+            "⚠️ Hugging Face took too long to answer. Please try again in a bit.",
+            ephemeral=True
+        )
     except Exception as e:
         await interaction.followup.send(
             f"⚠️ I couldn't talk to Hugging Face Inference Providers:\n```{e}```",
@@ -1564,11 +2221,10 @@ async def handle_llm_question(interaction: discord.Interaction, question: str) -
 
 
 @bot.tree.command(name="set-winner", description="Set the winner for a hackathon (admin only) 🏆")
+@app_commands.guild_only()
+@app_commands.checks.has_permissions(administrator=True)
+@app_commands.check(_require_guild)
 async def set_winner(interaction: discord.Interaction, hackathon: str, team: str, project: str = "", prize: str = ""):
-    if not interaction.user.guild_permissions.administrator:
-        await interaction.response.send_message("⚠️ Only admins can use `/set-winner`.", ephemeral=True)
-        return
-
     hackathon = sanitize_input(hackathon, MAX_HACKATHON_NAME_LENGTH)
     team = sanitize_input(team, MAX_TEAM_NAME_LENGTH)
     project = sanitize_input(project, MAX_PROJECT_LENGTH) or "—"
@@ -1577,6 +2233,9 @@ async def set_winner(interaction: discord.Interaction, hackathon: str, team: str
     if not hackathon or not team:
         await interaction.response.send_message("⚠️ Hackathon name and team are required.", ephemeral=True)
         return
+    if not is_valid_hackathon_name(hackathon):
+        await interaction.response.send_message("⚠️ Invalid hackathon name.", ephemeral=True)
+        return
 
     await state.set_winner(hackathon, {
         "hackathon": hackathon,
@@ -1586,72 +2245,87 @@ async def set_winner(interaction: discord.Interaction, hackathon: str, team: str
         "source": "manual",
     })
 
-    await interaction.response.send_message(
-        f"🏆 Winner saved for **{hackathon}**:\n"
-        f"• Team: **{team}**\n"
-        f"{'• Project: ' + project if project != '—' else ''}\n"
-        f"{'• Prize: ' + prize if prize != '—' else ''}",
-        ephemeral=True
-    )
+    lines = [f"🏆 Winner saved for **{hackathon}**:", f"• Team: **{team}**"]
+    if project != "—":
+        lines.append(f"• Project: {project}")
+    if prize != "—":
+        lines.append(f"• Prize: {prize}")
+    await interaction.response.send_message("\n".join(lines), ephemeral=True)
+
+
+WINNER_FIELD_TEMPLATE = "• **Team:** {team}\n• **Project:** {project}\n• **Prize:** {prize}"
+
+# (winners_version, embed) of the last /winners reply; rebuilt once winners change
+_winners_embed: Tuple[int, discord.Embed] | None = None
 
 
 @bot.tree.command(name="winners", description="Show recent Hackeroos hackathon winners 🏆")
 async def winners_cmd(interaction: discord.Interaction):
-    valid_entries = state.get_valid_winners()
-    if not valid_entries:
+    global _winners_embed
+    if _winners_embed is not None and _winners_embed[0] == state.winners_version:
+        await interaction.response.send_message(embed=_winners_embed[1], ephemeral=False)
+        return
+
+    version = state.winners_version
+    entries = state.get_recent_winners(RECENT_WINNERS_DISPLAY_COUNT)
+    if not entries:
         await interaction.response.send_message("🏆 No winners saved yet.", ephemeral=True)
         return
 
-    entries = valid_entries[-RECENT_WINNERS_DISPLAY_COUNT:]
     embed = discord.Embed(title="Hackeroos Hackathon Winners", color=0xfbbf24)
 
-    for item in reversed(entries):
-        hackathon_name = item.get("hackathon", "Unknown")
-        source = item.get("source")
+    for item in entries:
+        get = item.get
+        field_name = f"🏁 {get('hackathon', 'Unknown')}"
 
-        if source == "announcement" and item.get("announcement_text"):
-            embed.add_field(name=f"🏁 {hackathon_name}", value=item["announcement_text"][:1024], inline=False)
+        if get("source") == "announcement" and (text := get("announcement_text")):
+            embed.add_field(name=field_name, value=text[:1024], inline=False)
         else:
             embed.add_field(
-                name=f"🏁 {hackathon_name}",
-                value=(
-                    f"• **Team:** {item.get('team', '—')}\n"
-                    f"• **Project:** {item.get('project', '—')}\n"
-                    f"• **Prize:** {item.get('prize', '—')}"
-                ),
+                name=field_name,
+                value=WINNER_FIELD_TEMPLATE.format_map(defaultdict(lambda: "—", item)),
                 inline=False,
             )
 
     embed.set_footer(text="Configured via /set-winner or announcements • Pika-Bot")
+    _winners_embed = (version, embed)
     await interaction.response.send_message(embed=embed, ephemeral=False)
 
 
 @bot.command(name="sync")
+@commands.guild_only()
 @commands.has_permissions(administrator=True)
 async def sync_cmd(ctx: commands.Context):
     try:
-        synced = await bot.tree.sync()
-        await ctx.send(f"✅ Slash commands synced again ({len(synced)} commands).")
+        synced = await asyncio.wait_for(bot.tree.sync(), timeout=TREE_SYNC_TIMEOUT_SECONDS)
+        invalidate_help_embed()
+        await ctx.reply(f"✅ Slash commands synced again ({len(synced)} commands).", mention_author=False)
+    except asyncio.TimeoutError:
+        await ctx.reply("⚠️ Syncing slash commands timed out, try again shortly.", mention_author=False)
     except Exception as e:
-        await ctx.send(f"⚠️ Could not sync slash commands:\n`{e}`")
+        await ctx.reply(f"⚠️ Could not sync slash commands:\n`{e}`", mention_author=False)
 
 
 @bot.tree.command(name="update-hackathons", description="Manually refresh hackathons feed (admin only)")
 async def update_hackathons(interaction: discord.Interaction):
-    if not interaction.user.guild_permissions.administrator:
+    if not interaction.permissions.administrator:
         await interaction.response.send_message("⚠️ Only admins can update hackathons.", ephemeral=True)
         return
 
     await interaction.response.defer(ephemeral=True)
-    events = await fetch_hackathons()
+    events = await fetch_hackathons(max_age=0)  # manual refresh: always revalidate
     if not events:
         await interaction.followup.send("⚠️ Could not fetch any hackathons from API or fallback.", ephemeral=True)
         return
 
     os.makedirs("data", exist_ok=True)
     try:
-        async with aiofiles.open("data/hackathons.json", "w", encoding="utf-8") as f:
-            await f.write(json.dumps(events, indent=2, ensure_ascii=False))
+        if not await write_json_if_changed("data/hackathons.json", events):
+            await interaction.followup.send(
+                f"✅ Hackathons already up to date (**{len(events)}** events), nothing to save.",
+                ephemeral=True
+            )
+            return
         await interaction.followup.send(
             f"✅ Hackathons updated successfully.\nTotal events saved: **{len(events)}**.",
             ephemeral=True
@@ -1662,46 +2336,59 @@ async def update_hackathons(interaction: discord.Interaction):
 # -------------------------------------------------
 # 19) MAIN ENTRY POINT (Graceful shutdown + SIGTERM)
 # -------------------------------------------------
-_stop_event = asyncio.Event()
-
-
-def _request_stop() -> None:
-    _stop_event.set()
-
+def _install_fallback_signal_handlers(loop: asyncio.AbstractEventLoop, callback: Callable[[], None]) -> None:
+    """Windows / limited environments: plain signal handlers that hand off to the loop."""
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(sig, lambda *_: loop.call_soon_threadsafe(callback))
 
-async def main():
-    if not TOKEN:
-        raise RuntimeError("DISCORD_TOKEN missing in `.env`!")
 
+async def main() -> None:
     loop = asyncio.get_running_loop()
-    for sig in (signal.SIGINT, signal.SIGTERM):
-        try:
-            loop.add_signal_handler(sig, _request_stop)
-        except NotImplementedError:
-            # Windows / limited environments
-            pass
 
     try:
-        async with bot:
-            runner = asyncio.create_task(bot.start(TOKEN))
-            stopper = asyncio.create_task(_stop_event.wait())
+        stop_requested = False
 
-            done, pending = await asyncio.wait(
-                {runner, stopper},
-                return_when=asyncio.FIRST_COMPLETED,
-            )
+        # The group owns the runner task; a requested stop just cancels it
+        async with asyncio.TaskGroup() as tg:
+            runner = tg.create_task(bot.start(TOKEN))
 
-            if stopper in done:
-                log.info("Stop requested (SIGINT/SIGTERM). Closing bot...")
-                await bot.close()
+            def _request_stop() -> None:
+                nonlocal stop_requested
+                stop_requested = True
+                runner.cancel()
 
-            for t in pending:
-                t.cancel()
+            try:
+                loop.add_signal_handler(signal.SIGINT, _request_stop)
+                loop.add_signal_handler(signal.SIGTERM, _request_stop)
+            except NotImplementedError:
+                _install_fallback_signal_handlers(loop, _request_stop)
+
+        if stop_requested:
+            log.info("Stop requested (SIGINT/SIGTERM). Closing bot...")
+            # HTTP session is still open until bot.close(): flush mod-logs now
+            await drain_mod_log()
     finally:
-        await shutdown()
+        # Gateway disconnect and local cleanup are independent: run them together.
+        # bot.start() already runs the client's async setup, so no `async with bot`.
+        results = await asyncio.gather(bot.close(), shutdown(), return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                log.warning("Error during shutdown: %s", result)
 
 
 if __name__ == "__main__":
+    # Fail fast on bad config, before any event loop or signal setup
+    if not TOKEN:
+        raise SystemExit("DISCORD_TOKEN missing in `.env`!")
+
+    if sys.platform != "win32":
+        try:
+            # Optional: libuv-backed event loop (POSIX only)
+            import uvloop
+            uvloop.install()
+        except ImportError:
+            pass
+
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
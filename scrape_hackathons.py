@@ -4,11 +4,11 @@
 
 import os
 import re
-import json
 from datetime import datetime
 from typing import List, Dict, Any
 
 import httpx
+import orjson
 from bs4 import BeautifulSoup
 from seleniumbase import SB
 
@@ -60,8 +60,8 @@ def load_hackeroos_events() -> List[Dict[str, Any]]:
         return events
 
     try:
-        with open(HACKEROOS_INPUT, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        with open(HACKEROOS_INPUT, "rb") as f:
+            data = orjson.loads(f.read())
     except Exception as e:
         print(f"[Hackeroos] Failed to read JSON: {e}")
         return events
@@ -132,7 +132,7 @@ def scrape_devpost() -> List[Dict]:
         try:
             resp = httpx.get(base_url, params=qp, headers=headers, timeout=15.0)
             resp.raise_for_status()
-            data = resp.json()
+            data = orjson.loads(resp.content)
         except Exception as e:
             print(f"[Devpost] Error on page {page}: {e}")
             break
@@ -429,8 +429,8 @@ def main():
 
     os.makedirs(os.path.dirname(OUTPUT_PATH), exist_ok=True)
 
-    with open(OUTPUT_PATH, "w", encoding="utf-8") as f:
-        json.dump(merged, f, indent=2, ensure_ascii=False)
+    with open(OUTPUT_PATH, "wb") as f:
+        f.write(orjson.dumps(merged, option=orjson.OPT_INDENT_2))
 
     print(f"✅ Saved to {OUTPUT_PATH} at {datetime.utcnow().isoformat()}Z")
 